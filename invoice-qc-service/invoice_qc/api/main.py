@@ -10,9 +10,16 @@ Endpoints
 
 from __future__ import annotations
 
-import io
+import asyncio
+import contextlib
+import os
 from typing import List
 
+import aiofiles
+import anyio
+import anyio.to_thread
+import uvicorn
+from anyio.lowlevel import RunVar
 from fastapi import FastAPI, File, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -20,6 +27,28 @@ from ..extractor import extract_invoice_from_pdf
 from ..schema import BulkValidationReport, Invoice
 from ..validator import validate_invoices
 
+# Uploads are copied to disk in chunks of this size instead of being read into memory at once
+UPLOAD_CHUNK_SIZE = 1 << 16
+# Uploaded PDFs extracted at the same time, across all requests (extraction is CPU-bound)
+MAX_CONCURRENT_EXTRACTIONS = os.cpu_count() or 1
+# Limiters are bound to the event loop they are used in, so keep one per running loop
+# (the same way anyio keeps its default thread limiter)
+_extraction_limiter: RunVar[anyio.CapacityLimiter] = RunVar("_extraction_limiter")
+
+
+def _get_extraction_limiter() -> anyio.CapacityLimiter:
+    """
+    Return the extraction limiter of the running event loop, creating it on first use.
+    """
+    try:
+        return _extraction_limiter.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(MAX_CONCURRENT_EXTRACTIONS)
+        _extraction_limiter.set(limiter)
+        return limiter
+
+
+# With response_model set, FastAPI serializes responses straight to JSON through pydantic-core
 app = FastAPI(title="Invoice QC Service", version="1.0.0")
 
 # Basic CORS configuration (can be tightened in production)
@@ -51,6 +80,44 @@ async def validate_json(invoices: List[Invoice]) -> BulkValidationReport:
     return report
 
 
+async def _spool_upload_to_disk(file: UploadFile) -> str:
+    """
+    Stream an uploaded file to a temporary PDF on disk and return its path.
+    The caller is responsible for removing the file once this returns.
+    """
+    tmp_name = None
+    try:
+        async with aiofiles.tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+            tmp_name = tmp.name
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await tmp.write(chunk)
+    except BaseException:
+        # the caller never gets the path of a failed copy, so remove it here
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_name)
+        raise
+    return tmp_name
+
+
+async def _extract_upload(file: UploadFile) -> Invoice:
+    """
+    Extract a single uploaded PDF in a worker thread, at most MAX_CONCURRENT_EXTRACTIONS at a time.
+    """
+    pdf_path = await _spool_upload_to_disk(file)
+    try:
+        # extraction is blocking (PDF parsing / OCR), keep it off the event loop
+        invoice = await anyio.to_thread.run_sync(
+            extract_invoice_from_pdf, pdf_path, limiter=_get_extraction_limiter()
+        )
+    finally:
+        os.remove(pdf_path)
+    # Use uploaded filename as a fallback invoice identifier
+    if not invoice.invoice_number:
+        invoice.invoice_number = file.filename
+    return invoice
+
+
 @app.post("/extract-and-validate-pdfs", response_model=BulkValidationReport)
 async def extract_and_validate_pdfs(
     files: List[UploadFile] = File(..., description="One or more PDF invoice files."),
@@ -58,20 +125,22 @@ async def extract_and_validate_pdfs(
     """
     Optional endpoint to upload PDF files, extract invoice data and validate it.
     """
-    invoices: List[Invoice] = []
-    for file in files:
-        content = await file.read()
-        buffer = io.BytesIO(content)
-        invoice = extract_invoice_from_pdf(buffer)
-        # Use uploaded filename as a fallback invoice identifier
-        if not invoice.invoice_number:
-            invoice.invoice_number = file.filename
-        invoices.append(invoice)
-
+    # Uploaded PDFs are extracted concurrently (bounded by the extraction limiter); gather keeps the upload order
+    invoices: List[Invoice] = list(await asyncio.gather(*(_extract_upload(file) for file in files)))
     return validate_invoices(invoices)
 
 
+def main() -> None:
+    """
+    Serve the API with uvicorn. loop/http "auto" pick uvloop and httptools when
+    installed (uvicorn[standard]) and fall back to asyncio/h11 otherwise (e.g. Windows).
+    """
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="auto", http="auto")
+
+
 # For local development convenience:
 #   uvicorn invoice_qc.api.main:app --reload
+if __name__ == "__main__":
+    main()
 
 
@@ -9,11 +9,11 @@ Usage examples:
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+import orjson
 import typer
 
 from .extractor import extract_invoices_from_directory
@@ -22,6 +22,9 @@ from .validator import validate_invoices
 
 app = typer.Typer(help="Invoice extraction and validation CLI.")
 
+# dates/datetimes are serialized natively by orjson; naive datetimes are treated as UTC
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
 
 def _ensure_parent_directory(path: Path) -> None:
     """
@@ -31,6 +34,35 @@ def _ensure_parent_directory(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _json_default(obj):
+    """
+    orjson fallback for the few types it cannot serialize natively. Like the stdlib
+    writer's default=str, anything else is stringified rather than aborting a write.
+    """
+    return str(obj)
+
+
+def _write_json(path: Path, payload) -> None:
+    """
+    Serialize a payload to a JSON file using orjson.
+    """
+    path.write_bytes(orjson.dumps(payload, option=_JSON_OPTIONS, default=_json_default))
+
+
+def _write_invoices_json(path: Path, invoices: Iterable[Invoice]) -> None:
+    """
+    Stream invoices to a JSON array file one element at a time, so only a single
+    invoice dict and its serialized bytes are held in memory at once.
+    """
+    with path.open("wb") as f:
+        separator = b"[\n"
+        for inv in invoices:
+            f.write(separator)
+            f.write(orjson.dumps(inv.model_dump(), option=_JSON_OPTIONS, default=_json_default))
+            separator = b",\n"
+        f.write(b"[]\n" if separator == b"[\n" else b"\n]\n")
+
+
 @app.command()
 def extract(
     pdf_dir: str = typer.Option(
@@ -43,6 +75,17 @@ def extract(
         "--output",
         help="Path to write extracted invoice data as JSON.",
     ),
+    force_refresh: bool = typer.Option(
+        False,
+        "--force-refresh",
+        help="Ignore cached extraction results and re-parse every PDF.",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Number of extraction worker processes (default: one per CPU).",
+    ),
 ) -> None:
     """
     Extract structured data from PDF invoices in a directory.
@@ -52,12 +95,11 @@ def extract(
         typer.echo(f"PDF directory not found: {pdf_directory}", err=True)
         raise typer.Exit(code=1)
 
-    invoices = extract_invoices_from_directory(pdf_directory)
+    invoices = extract_invoices_from_directory(pdf_directory, max_workers=workers, force_refresh=force_refresh)
 
     output_path = Path(output)
     _ensure_parent_directory(output_path)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump([inv.dict() for inv in invoices], f, indent=2, default=str)
+    _write_invoices_json(output_path, invoices)
 
     typer.echo(f"Extracted {len(invoices)} invoices to {output_path}")
 
@@ -83,15 +125,15 @@ def validate(
         typer.echo(f"Input JSON not found: {input_path}", err=True)
         raise typer.Exit(code=1)
 
-    invoices_data = json.loads(input_path.read_text(encoding="utf-8") or "[]")
-    invoices = [Invoice.parse_obj(obj) for obj in invoices_data]
+    invoices_data = orjson.loads(input_path.read_bytes() or b"[]")
+    # the input file is untrusted, so coerce and validate it against the schema
+    invoices = [Invoice.model_validate(obj) for obj in invoices_data]
 
     report_obj: BulkValidationReport = validate_invoices(invoices)
 
     report_path = Path(report)
     _ensure_parent_directory(report_path)
-    with report_path.open("w", encoding="utf-8") as f:
-        json.dump(report_obj.dict(), f, indent=2, default=str)
+    _write_json(report_path, report_obj.model_dump())
 
     # Print summary to CLI
     summary = report_obj.summary
@@ -117,6 +159,17 @@ def full_run(
         "--report",
         help="Path to write the validation report as JSON.",
     ),
+    force_refresh: bool = typer.Option(
+        False,
+        "--force-refresh",
+        help="Ignore cached extraction results and re-parse every PDF.",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Number of extraction worker processes (default: one per CPU).",
+    ),
 ) -> None:
     """
     Perform extraction and validation in a single command.
@@ -125,16 +178,14 @@ def full_run(
     _ensure_parent_directory(temp_extracted_path)
 
     # Step 1: Extract
-    invoices = extract_invoices_from_directory(pdf_dir)
-    with temp_extracted_path.open("w", encoding="utf-8") as f:
-        json.dump([inv.dict() for inv in invoices], f, indent=2, default=str)
+    invoices = extract_invoices_from_directory(pdf_dir, max_workers=workers, force_refresh=force_refresh)
+    _write_invoices_json(temp_extracted_path, invoices)
 
     # Step 2: Validate
     report_obj = validate_invoices(invoices)
     report_path = Path(report)
     _ensure_parent_directory(report_path)
-    with report_path.open("w", encoding="utf-8") as f:
-        json.dump(report_obj.dict(), f, indent=2, default=str)
+    _write_json(report_path, report_obj.model_dump())
 
     summary = report_obj.summary
     typer.echo(f"Total invoices: {summary.total_invoices}")
@@ -1,8 +1,8 @@
 """
-Multilingual (EN + DE) PDF invoice extraction utilities using pdfplumber and pytesseract.
+Multilingual (EN + DE) PDF invoice extraction utilities using PyMuPDF, pdfplumber and pytesseract.
 
 Features:
-- Layout-aware text reconstruction using page.extract_words()
+- Layout-aware text reconstruction from PyMuPDF word boxes grouped into rows (pdfplumber page.extract_words() as fallback)
 - Language detection (simple heuristics) to switch between English/German patterns
 - Number normalization for German (comma decimals) and English (dot decimals)
 - OCR fallback using pdf2image + pytesseract for scanned PDFs or poor text extraction
@@ -11,20 +11,48 @@ Features:
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import io
 import os
+import pickle
 import re
 import tempfile
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
+import pymupdf
 import pdfplumber
-from pdf2image import convert_from_path
+from pdfplumber.utils import cluster_objects
+from pdf2image import convert_from_bytes, convert_from_path, pdfinfo_from_bytes, pdfinfo_from_path
 from PIL import Image
 import pytesseract
 
+try:
+    # Optional: in-process Tesseract engine that can be reused across pages
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+try:
+    # Optional: Aho-Corasick automaton for single-pass keyword matching
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: linear-time RE2 regex engine (google-re2), enabled with INVOICE_QC_USE_RE2
+    import re2
+except ImportError:
+    re2 = None
+
 from .schema import Invoice, InvoiceLineItem
+from .validator import parse_maybe_date
 
 # Configure Tesseract path for Windows
 TESSE_RECT_PATHS = [
@@ -38,11 +66,68 @@ for p in TESSE_RECT_PATHS:
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, falling back to default on bad values."""
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logging.warning(f"Ignoring non-integer {name}={raw!r}; using {default}.")
+        return default
+
+
+# Pages whose text layer has fewer characters than this are OCRed
+MIN_PAGE_TEXT_CHARS = 20
+# Render resolution for OCR; 200 dpi is enough for >= 8pt invoice text at ~half the pixels of 300 dpi
+OCR_DPI = 200
+# Maximum number of pages OCRed at the same time within one PDF. Tesseract's LSTM engine
+# already runs about 4 OpenMP threads per page, so by default one page is OCRed per 4 CPUs.
+OCR_CONCURRENCY = _env_int("OCR_CONCURRENCY", max(1, (os.cpu_count() or 1) // 4))
+# Page images wider than this are halved before OCR, and pixels are binarized at this grey level
+OCR_MAX_WIDTH = 2000
+OCR_BINARIZE_THRESHOLD = 160
+# Longest run of consecutive sparse pages rendered and OCRed as one unit (bounds images held per worker)
+OCR_BATCH_PAGES = 8
+# LSTM engine + single uniform block segmentation: the fastest useful mode for invoice pages
+OCR_CONFIG = "--oem 1 --psm 6"
+
+# Text layer backend: "pymupdf" (default, alias "fitz") reads with PyMuPDF first, "pdfplumber" skips it
+PDF_BACKENDS = ("pymupdf", "fitz", "pdfplumber")
+PDF_BACKEND = (os.getenv("INVOICE_QC_BACKEND") or "pymupdf").lower()
+if PDF_BACKEND not in PDF_BACKENDS:
+    logging.warning(f"Unknown INVOICE_QC_BACKEND {PDF_BACKEND!r}; expected one of {PDF_BACKENDS}. Using pymupdf.")
+    PDF_BACKEND = "pymupdf"
+
+# Extracted invoices are cached on disk, keyed by a hash of the PDF bytes, this version and PDF_BACKEND.
+# Bump CACHE_VERSION whenever extraction output or the pickled Invoice schema changes.
+CACHE_VERSION = "2"
+CACHE_DIR = Path(os.getenv("INVOICE_QC_CACHE_DIR", str(Path.home() / ".cache" / "invoice-qc")))
+
+# Compile the extraction patterns with RE2 instead of the backtracking `re` engine (needs google-re2)
+USE_RE2 = os.getenv("INVOICE_QC_USE_RE2", "").lower() in ("1", "true", "yes")
+
+
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a pattern with RE2 when enabled and installed, otherwise with `re`.
+    Flags are given inline (e.g. "(?i)") so both engines read them the same way.
+    """
+    if USE_RE2 and re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            logging.warning(f"RE2 rejected pattern {pattern!r}; using re instead.")
+    return re.compile(pattern)
+
+
 # ---------------- Patterns ----------------
-EN_INVOICE_NO = re.compile(r"(?:Invoice\s*(?:No\.?|Number)?\s*[:#]?\s*)([A-Za-z0-9\-_/]+)", re.IGNORECASE)
-DE_INVOICE_NO = re.compile(r"(?:Rechnungs(?:nr\.|nummer)?|Belegnr\.?)\s*[:#]?\s*([A-Za-z0-9\-_/]+)", re.IGNORECASE)
+EN_INVOICE_NO = _compile_pattern(r"(?i)(?:Invoice\s*(?:No\.?|Number)?\s*[:#]?\s*)([A-Za-z0-9\-_/]+)")
+DE_INVOICE_NO = _compile_pattern(r"(?i)(?:Rechnungs(?:nr\.|nummer)?|Belegnr\.?)\s*[:#]?\s*([A-Za-z0-9\-_/]+)")
 
-EN_DATE = re.compile(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4})")
+EN_DATE = _compile_pattern(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4})")
 DE_DATE = EN_DATE  # same formats usually; keep same regex
 
 EN_TOTAL_KEYWORDS = ["total", "subtotal", "grand total", "amount due"]
@@ -51,30 +136,94 @@ DE_TOTAL_KEYWORDS = ["gesamtwert", "gesamtbetrag", "betrag", "gesamt", "gesamtwe
 EN_VAT_KEYWORDS = ["tax", "vat"]
 DE_VAT_KEYWORDS = ["mwst", "umsatzsteuer"]
 
+
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile a keyword list into one alternation so a line is checked with a single search."""
+    return _compile_pattern("|".join(map(re.escape, keywords)))
+
+
+# Characters of an amount token, scanned by _last_amount
+_NUM_CHARS = frozenset("0123456789.,")
+_DIGITS = "0123456789"
+_NUMBER_TOKEN_RE = _compile_pattern(r"([0-9]+(?:[.,][0-9]+)?)")
+_NUMBER_STRIP_RE = _compile_pattern(r"[0-9]+(?:[.,][0-9]+)?")
+_NON_NUMERIC_RE = _compile_pattern(r"[^\d,.\-]")
+# Characters _NON_NUMERIC_RE keeps; strings made only of these need no cleanup
+_NUMERIC_CHARS = frozenset("0123456789,.-")
+
+# Keyword categories used by _scan_lines for totals and line items (matched against lowercased lines)
+_KEYWORD_CATEGORIES: Dict[str, Dict[str, List[str]]] = {
+    "en": {
+        "tax": EN_VAT_KEYWORDS,
+        "total": EN_TOTAL_KEYWORDS,
+        "net": ["net"],
+        "totals_block": EN_TOTAL_KEYWORDS + EN_VAT_KEYWORDS + ["total"],
+    },
+    "de": {
+        "tax": ["mwst", "ust", "umsatzsteuer"],
+        "gross": ["gesamtwert inkl", "gesamtwert inkl.", "gesamtwert", "gesamtbetrag", "gesamt"],
+        "net": ["netto"],
+        "total": DE_TOTAL_KEYWORDS,
+        "totals_block": DE_TOTAL_KEYWORDS + DE_VAT_KEYWORDS + ["gesamt"],
+    },
+}
+
+
+def _build_keyword_matcher(categories: Dict[str, List[str]]) -> Callable[[str], Set[str]]:
+    """
+    Build a function returning the set of keyword categories found in a lowercased line.
+    With pyahocorasick installed every keyword is found in one automaton pass over the line;
+    otherwise one precompiled alternation per category is searched.
+    """
+    if ahocorasick is not None:
+        categories_by_keyword: Dict[str, Set[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                categories_by_keyword.setdefault(keyword, set()).add(category)
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_categories in categories_by_keyword.items():
+            automaton.add_word(keyword, frozenset(keyword_categories))
+        automaton.make_automaton()
+
+        def match_automaton(low: str) -> Set[str]:
+            hits: Set[str] = set()
+            for _, keyword_categories in automaton.iter(low):
+                hits |= keyword_categories
+            return hits
+
+        return match_automaton
+
+    patterns = [(category, _keyword_pattern(keywords)) for category, keywords in categories.items()]
+
+    def match_patterns(low: str) -> Set[str]:
+        return {category for category, pattern in patterns if pattern.search(low)}
+
+    return match_patterns
+
+
+_KEYWORD_MATCHERS = {lang: _build_keyword_matcher(categories) for lang, categories in _KEYWORD_CATEGORIES.items()}
+
 # ---------------- Utilities ----------------
 
 
-def _safe_temp_pdf_from_bytes(b: Union[bytes, bytearray, io.BytesIO]) -> Tuple[str, tempfile.NamedTemporaryFile]:
-    """Write bytes/file-like to a temporary PDF file and return its path."""
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    if isinstance(b, (bytes, bytearray)):
-        tmp.write(b)
-    else:
-        # assume BytesIO or file-like
-        tmp.write(b.read())
-    tmp.flush()
-    tmp.close()
-    return tmp.name, tmp
+GERMAN_MARKERS = ["gesamtwert", "mwst", "kundennummer", "bestellung", "artikelbeschreibung", "menge"]
+ENGLISH_MARKERS = ["invoice", "total", "tax", "quantity", "description"]
+
+# Each marker is its own category, so one pass over the text returns the distinct markers present
+_LANGUAGE_MARKER_MATCHER = _build_keyword_matcher({marker: [marker] for marker in GERMAN_MARKERS + ENGLISH_MARKERS})
+
+
+def _detect_language_from_lower(text_lower: str) -> str:
+    """Language detection over the already-lowercased text."""
+    found = _LANGUAGE_MARKER_MATCHER(text_lower)
+    german_count = sum(1 for w in GERMAN_MARKERS if w in found)
+    english_count = sum(1 for w in ENGLISH_MARKERS if w in found)
+    return "de" if german_count >= english_count and german_count > 0 else "en"
 
 
 def detect_language(text: str) -> str:
     """Simple heuristic-based language detection for German vs English."""
-    low = text.lower()
-    german_markers = ["gesamtwert", "mwst", "kundennummer", "bestellung", "artikelbeschreibung", "menge"]
-    german_count = sum(1 for w in german_markers if w in low)
-    english_markers = ["invoice", "total", "tax", "quantity", "description"]
-    english_count = sum(1 for w in english_markers if w in low)
-    return "de" if german_count >= english_count and german_count > 0 else "en"
+    return _detect_language_from_lower(text.lower())
 
 
 def normalize_number(num_str: str, lang: str = "en") -> Optional[float]:
@@ -85,9 +234,13 @@ def normalize_number(num_str: str, lang: str = "en") -> Optional[float]:
     """
     if not num_str:
         return None
-    s = num_str.strip()
-    # remove currency symbols and stray characters
-    s = re.sub(r"[^\d,.\-]", "", s)
+    s = num_str
+    # remove currency symbols and stray characters (tokens from the line regexes have none)
+    if not _NUMERIC_CHARS.issuperset(s):
+        s = _NON_NUMERIC_RE.sub("", s)
+    if not s.strip(",.-"):
+        # separators only, no digit: skip the float() attempt and its exception
+        return None
     if lang == "de":
         # convert "1.285,20" -> "1285.20"
         # But be careful: "160,0000" might be "160.0000" (rare). We'll treat last comma as decimal.
@@ -107,121 +260,297 @@ def normalize_number(num_str: str, lang: str = "en") -> Optional[float]:
         return None
 
 
-def _group_words_to_lines(words: List[dict], y_tolerance: int = 3) -> List[str]:
+# pdfplumber always populates these word keys, so index directly instead of dict.get() with defaults
+_word_x0 = itemgetter("x0")
+_word_text = itemgetter("text")
+# PyMuPDF word tuples: (x0, y0, x1, y1, text, block_no, line_no, word_no), y0 measured from the top
+_MUPDF_WORD_TOP = 1
+_mupdf_word_x0 = itemgetter(0)
+_mupdf_word_text = itemgetter(4)
+
+
+def _group_words_to_lines(
+    words: List,
+    y_tolerance: int = 3,
+    top_key: Union[str, int] = "top",
+    x0_key: Callable = _word_x0,
+    text_key: Callable = _word_text,
+) -> List[str]:
     """
     Given words from pdfplumber page.extract_words(), group by approximate y coordinate to form lines.
     Sort words in each line by x0 to preserve left-to-right order.
+    The key arguments select the same fields from other word records (e.g. PyMuPDF word tuples).
     """
-    # Each word dict includes 'text', 'x0', 'top', ...
-    # bucket by rounded top (or center)
-    buckets: Dict[int, List[dict]] = {}
-    for w in words:
-        # Use vertical center
-        y_center = int(round((w.get("top", 0) + w.get("bottom", 0)) / 2))
-        # find an existing bucket within tolerance
-        found_key = None
-        for key in buckets:
-            if abs(key - y_center) <= y_tolerance:
-                found_key = key
-                break
-        if found_key is None:
-            buckets[y_center] = [w]
-        else:
-            buckets[found_key].append(w)
-
-    # Build lines sorted by y (top to bottom) and words by x0
+    # pdfplumber's own clustering: rows of words whose tops lie within y_tolerance, top to bottom
     lines = []
-    for y in sorted(buckets.keys(), reverse=False):
-        line_words = sorted(buckets[y], key=lambda item: item.get("x0", 0))
-        line_text = " ".join(w.get("text", "") for w in line_words).strip()
+    for row in cluster_objects(words, top_key, y_tolerance):
+        line_text = " ".join(map(text_key, sorted(row, key=x0_key))).strip()
         if line_text:
             lines.append(line_text)
     return lines
 
 
-def extract_text_layout_aware(source: Union[str, Path, bytes, io.BytesIO]) -> str:
+def _pdf_buffer(source: Union[bytes, bytearray, io.BytesIO]) -> io.BytesIO:
+    """Wrap bytes in a BytesIO (or rewind an existing file-like) for the PDF readers."""
+    buffer = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    buffer.seek(0)
+    return buffer
+
+
+def _plumber_pages(page_indices: Optional[Sequence[int]]) -> Optional[List[int]]:
+    """Convert 0-based page indices to the 1-based page numbers pdfplumber.open() expects."""
+    return None if page_indices is None else [page_idx + 1 for page_idx in page_indices]
+
+
+def _closing_pages(pdf: pdfplumber.PDF) -> Iterator[pdfplumber.page.Page]:
+    """
+    Yield the pages of an open pdfplumber document, closing each one once the caller moves on
+    so only one page's parsed layout objects are held in memory at a time.
+    """
+    for page in pdf.pages:
+        yield page
+        page.close()
+
+
+def _extract_pages_pymupdf(
+    source: Union[str, Path, bytes, io.BytesIO], page_indices: Optional[Sequence[int]] = None
+) -> List[List[str]]:
+    """
+    Use PyMuPDF to extract words and rebuild physical rows the same way as the pdfplumber path.
+    MuPDF's own blocks put each table cell or column in a block of its own, which would split
+    invoice rows such as "Gesamtwert EUR 216,00" apart, so only its word boxes are used.
+    Returns the text lines of each page (only of page_indices, 0-based, when given).
+    """
+    if isinstance(source, (str, Path)):
+        doc = pymupdf.open(str(source))
+    else:
+        doc = pymupdf.open(stream=_pdf_buffer(source).read(), filetype="pdf")
+    with doc:
+        pages: List[List[str]] = []
+        for page in doc if page_indices is None else (doc[page_idx] for page_idx in page_indices):
+            words = page.get_text("words")
+            pages.append(
+                _group_words_to_lines(words, top_key=_MUPDF_WORD_TOP, x0_key=_mupdf_word_x0, text_key=_mupdf_word_text)
+            )
+        return pages
+
+
+def _extract_pages_pdfplumber(
+    source: Union[str, Path, bytes, io.BytesIO], page_indices: Optional[Sequence[int]] = None
+) -> List[List[str]]:
     """
     Use pdfplumber to extract words and rebuild lines preserving column layout.
-    Falls back to page.extract_text() if extract_words() yields nothing meaningful.
+    A page without words has no text layer, so it contributes an empty page (left to OCR).
+    """
+    pdf_input = Path(source) if isinstance(source, (str, Path)) else _pdf_buffer(source)
+    with pdfplumber.open(pdf_input, pages=_plumber_pages(page_indices)) as pdf:
+        pages: List[List[str]] = []
+        for page in _closing_pages(pdf):
+            # x0/x1/top/bottom are always present on words; passing them as extra_attrs would
+            # split words at every char (extra_attrs must match across a word). Lines are
+            # regrouped by position below, so the PDF's own text flow order is fine here.
+            words = page.extract_words(keep_blank_chars=False, use_text_flow=True)
+            pages.append(_group_words_to_lines(words))
+        return pages
+
+
+def _extract_page_lines(
+    source: Union[str, Path, bytes, io.BytesIO], page_indices: Optional[Sequence[int]] = None
+) -> List[List[str]]:
     """
+    Extract the text lines of every page (or of page_indices, 0-based) with PyMuPDF, falling back
+    to pdfplumber word grouping and finally to pdfplumber's plain page.extract_text().
+    With PDF_BACKEND "pdfplumber" extraction starts at the word grouping.
+    """
+    if PDF_BACKEND in ("pymupdf", "fitz"):
+        try:
+            return _extract_pages_pymupdf(source, page_indices)
+        except Exception as e:
+            logging.warning(f"PyMuPDF extraction failed: {e}. Falling back to pdfplumber.")
+
     try:
-        if isinstance(source, (str, Path)):
-            pdf_path = Path(source)
-            with pdfplumber.open(pdf_path) as pdf:
-                page_texts = []
-                for page in pdf.pages:
-                    words = page.extract_words(extra_attrs=["x0", "x1", "top", "bottom"])
-                    if words:
-                        lines = _group_words_to_lines(words)
-                        page_texts.append("\n".join(lines))
-                    else:
-                        # fallback to plain text
-                        page_texts.append(page.extract_text() or "")
-                return "\n\n".join(page_texts)
-        else:
-            buffer = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
-            # pdfplumber.open accepts file-like, but ensure it's at start
-            buffer.seek(0)
-            with pdfplumber.open(buffer) as pdf:
-                page_texts = []
-                for page in pdf.pages:
-                    words = page.extract_words(extra_attrs=["x0", "x1", "top", "bottom"])
-                    if words:
-                        lines = _group_words_to_lines(words)
-                        page_texts.append("\n".join(lines))
-                    else:
-                        page_texts.append(page.extract_text() or "")
-                return "\n\n".join(page_texts)
+        return _extract_pages_pdfplumber(source, page_indices)
     except Exception as e:
         logging.warning(f"Layout-aware extraction failed: {e}. Falling back to pdfplumber.extract_text()")
         # Try a simple fallback
         try:
-            if isinstance(source, (str, Path)):
-                with pdfplumber.open(source) as pdf:
-                    return "\n".join((page.extract_text() or "") for page in pdf.pages)
-            else:
-                buffer.seek(0)
-                with pdfplumber.open(buffer) as pdf:
-                    return "\n".join((page.extract_text() or "") for page in pdf.pages)
+            pdf_input = source if isinstance(source, (str, Path)) else _pdf_buffer(source)
+            with pdfplumber.open(pdf_input, pages=_plumber_pages(page_indices)) as pdf:
+                # plain (non-layout) text with the default tolerances; the lines are split right away
+                return [
+                    (page.extract_text(x_tolerance=3, y_tolerance=3, layout=False) or "").splitlines()
+                    for page in _closing_pages(pdf)
+                ]
         except Exception as e2:
             logging.error(f"Fallback extraction failed: {e2}")
-            return ""
+            return []
+
+
+def _join_pages(pages: List[List[str]]) -> str:
+    """Join per-page lines into one text in a single pass, pages separated by a blank line."""
+    out: List[str] = []
+    for page_idx, lines in enumerate(pages):
+        if page_idx:
+            out.append("")
+        out.extend(lines)
+    return "\n".join(out)
+
+
+def extract_text_layout_aware(
+    source: Union[str, Path, bytes, io.BytesIO], pages: Optional[Sequence[int]] = None
+) -> str:
+    """
+    Extract layout-aware text with PyMuPDF, falling back to pdfplumber word grouping
+    and finally to pdfplumber's plain page.extract_text().
+    Pass pages (0-based indices) to read only part of a large document.
+    """
+    return _join_pages(_extract_page_lines(source, pages))
 
 
 # ---------------- OCR fallback ----------------
 
 
-def _extract_text_with_ocr(source: Union[str, Path, bytes, io.BytesIO]) -> str:
+def _prepare_for_ocr(img: Image.Image) -> Image.Image:
     """
-    Convert PDF pages to images and perform OCR with pytesseract.
-    convert_from_path cannot take BytesIO directly; for bytes we create a temp file.
+    Grayscale, downscale and binarize a page image so Tesseract works on far fewer bytes
+    than the full-resolution RGB render (it would binarize internally anyway).
     """
-    tmp_file_obj = None
-    try:
-        if isinstance(source, (str, Path)):
-            pdf_path = str(source)
+    img = img.convert("L")
+    if img.width > OCR_MAX_WIDTH:
+        img = img.resize((img.width // 2, img.height // 2), Image.LANCZOS)
+    return img.point(lambda p: 255 if p > OCR_BINARIZE_THRESHOLD else 0)
+
+
+def _ocr_images(images: List[Image.Image]) -> List[str]:
+    """
+    OCR page images, paying Tesseract's start-up cost once per PDF rather than once per page.
+    Uses a single tesserocr engine when installed; otherwise all pages are written to one
+    multi-page TIFF and recognized by a single tesseract invocation.
+    """
+    if not images:
+        return []
+    if tesserocr is not None:
+        texts = []
+        with tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY) as api:
+            for img in images:
+                api.SetImage(img)
+                texts.append(api.GetUTF8Text())
+        return texts
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tiff_path = os.path.join(tmp_dir, "pages.tiff")
+        images[0].save(tiff_path, save_all=True, append_images=images[1:])
+        # tesseract terminates every page of a multi-page input with a form feed
+        return pytesseract.image_to_string(tiff_path, config=OCR_CONFIG).split("\f")[: len(images)]
+
+
+def _render_pages(
+    source: Union[str, Path, bytes, io.BytesIO],
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+    thread_count: int = OCR_CONCURRENCY,
+) -> List[Image.Image]:
+    """
+    Render PDF pages (1-based, inclusive range; all pages by default) to images prepared for OCR.
+    thread_count Poppler processes render in parallel; it defaults to the OCR budget rather than
+    all CPUs, since extraction may already run one process per CPU.
+    """
+    if isinstance(source, (str, Path)):
+        images = convert_from_path(
+            str(source), dpi=OCR_DPI, thread_count=thread_count, first_page=first_page, last_page=last_page
+        )
+    else:
+        pdf_bytes = bytes(source) if isinstance(source, (bytes, bytearray)) else _pdf_buffer(source).read()
+        images = convert_from_bytes(
+            pdf_bytes, dpi=OCR_DPI, thread_count=thread_count, first_page=first_page, last_page=last_page
+        )
+    return [_prepare_for_ocr(img) for img in images]
+
+
+def _pdf_page_count(source: Union[str, Path, bytes, io.BytesIO]) -> int:
+    """Return the number of pages of a PDF as reported by Poppler's pdfinfo."""
+    if isinstance(source, (str, Path)):
+        return int(pdfinfo_from_path(str(source))["Pages"])
+    pdf_bytes = bytes(source) if isinstance(source, (bytes, bytearray)) else _pdf_buffer(source).read()
+    return int(pdfinfo_from_bytes(pdf_bytes)["Pages"])
+
+
+def _page_runs(page_indices: List[int], max_pages: int) -> List[Tuple[int, int]]:
+    """Group 0-based page indices into (first, last) runs of at most max_pages consecutive pages."""
+    runs: List[Tuple[int, int]] = []
+    for page_idx in page_indices:
+        if runs and page_idx == runs[-1][1] + 1 and page_idx - runs[-1][0] < max_pages:
+            runs[-1] = (runs[-1][0], page_idx)
         else:
-            path, tmp_file_obj = _safe_temp_pdf_from_bytes(source)
-            pdf_path = path
-
-        images = convert_from_path(pdf_path)
-        ocr_pages = []
-        for img in images:
-            # if color mode is not RGB, convert
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-            text = pytesseract.image_to_string(img)
-            ocr_pages.append(text)
-        return "\n\n".join(ocr_pages)
+            runs.append((page_idx, page_idx))
+    return runs
+
+
+def _ocr_page_run(
+    source: Union[str, Path, bytes], run: Tuple[int, int], thread_count: int = 1
+) -> List[Optional[str]]:
+    """
+    Render a run of consecutive pages (0-based, inclusive) with one pdf2image call and OCR it
+    right away. A failure only affects the pages of this run, which come back as None.
+    """
+    first_idx, last_idx = run
+    page_count = last_idx - first_idx + 1
+    try:
+        images = _render_pages(source, first_page=first_idx + 1, last_page=last_idx + 1, thread_count=thread_count)
+        texts = _ocr_images(images)
+    except Exception as e:
+        logging.error(f"OCR of pages {first_idx + 1}-{last_idx + 1} failed: {e}")
+        return [None] * page_count
+    return texts + [""] * (page_count - len(texts))
+
+
+def _ocr_pages(source: Union[str, Path, bytes, io.BytesIO], page_indices: List[int]) -> List[Optional[str]]:
+    """
+    OCR the given pages (0-based). Consecutive pages are grouped into runs of at most
+    OCR_BATCH_PAGES, each rendered with a single pdf2image call (one Poppler start instead of
+    one per page) and OCRed as soon as it is rendered; up to OCR_CONCURRENCY runs are in flight.
+    Results are returned in the order of page_indices, with None for pages whose OCR failed.
+    """
+    if not page_indices:
+        return []
+    if not isinstance(source, (str, Path)):
+        # worker threads must not share a file-like object's read position
+        source = bytes(source) if isinstance(source, (bytes, bytearray)) else _pdf_buffer(source).read()
+
+    workers = min(len(page_indices), OCR_CONCURRENCY)
+    # spread the pages over the workers, but never hold more than OCR_BATCH_PAGES images per worker
+    runs = _page_runs(page_indices, min(OCR_BATCH_PAGES, -(-len(page_indices) // workers)))
+    workers = min(workers, len(runs))
+    # concurrent runs share the OCR budget for their Poppler render threads too
+    render_threads = max(1, OCR_CONCURRENCY // workers)
+    if workers <= 1:
+        run_texts = [_ocr_page_run(source, run, render_threads) for run in runs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            run_texts = list(
+                executor.map(functools.partial(_ocr_page_run, source, thread_count=render_threads), runs)
+            )
+
+    texts: Dict[int, Optional[str]] = {}
+    for (first_idx, last_idx), page_texts in zip(runs, run_texts):
+        texts.update(zip(range(first_idx, last_idx + 1), page_texts))
+    return [texts[page_idx] for page_idx in page_indices]
+
+
+def _extract_text_with_ocr(source: Union[str, Path, bytes, io.BytesIO]) -> Tuple[str, bool]:
+    """
+    OCR every page of the PDF with pytesseract, run by run through _ocr_pages, so only
+    a few rendered pages are held in memory at once.
+    Returns the text and whether OCR succeeded on every page.
+    """
+    try:
+        if not isinstance(source, (str, Path)):
+            source = bytes(source) if isinstance(source, (bytes, bytearray)) else _pdf_buffer(source).read()
+        texts = _ocr_pages(source, list(range(_pdf_page_count(source))))
     except Exception as e:
         logging.error(f"OCR extraction failed: {e}")
-        return ""
-    finally:
-        if tmp_file_obj:
-            try:
-                os.remove(tmp_file_obj.name)
-            except Exception:
-                pass
+        return "", False
+    return "\n\n".join(text or "" for text in texts), None not in texts
 
 
 # ---------------- Field extractors ----------------
@@ -235,154 +564,225 @@ def _guess_invoice_number(text: str, lang: str = "en") -> Optional[str]:
     return m.group(1).strip() if m else None
 
 
-def _guess_dates(text: str, lang: str = "en") -> Dict[str, Optional[str]]:
-    matches = EN_DATE.findall(text)
-    invoice_date = matches[0] if matches else None
-    due_date = matches[1] if len(matches) > 1 else None
-    return {"invoice_date": invoice_date, "due_date": due_date}
+def _last_amount(line: str, lang: str = "en") -> Optional[float]:
+    """
+    Normalized value of the last run of number characters on a line (the likely amount on
+    a totals line). Amounts usually end the line, so walk back from the end instead of
+    running a regex over the whole line.
+    """
+    end = len(line)
+    if end and line[-1] not in _NUM_CHARS and not any(digit in line for digit in _DIGITS):
+        # no digit anywhere: any run of separators left would not parse as an amount
+        return None
+    while end and line[end - 1] not in _NUM_CHARS:
+        end -= 1
+    start = end
+    while start and line[start - 1] in _NUM_CHARS:
+        start -= 1
+    return normalize_number(line[start:end], lang)
 
 
-def _guess_totals(text: str, lang: str = "en") -> Dict[str, Optional[float]]:
+def _resolve_totals(candidates: List[Tuple[float, Set[str]]], lang: str = "en") -> Dict[str, Optional[float]]:
     """
-    Finds gross/total and tax amounts using keyword heuristics.
-    Returns numeric values (floats) normalized depending on language.
+    Assigns net/tax/gross from (amount, keyword categories) pairs of the lines carrying an
+    amount, given in document order.
     """
     net_total = tax_amount = gross_total = None
-    lines = text.splitlines()
     # Scan bottom-up, totals often near the end
-    for line in reversed(lines):
-        low = line.lower()
-        # Find numbers on the line
-        nums = re.findall(r"([0-9.,]+)", line)
-        if not nums:
-            continue
-        # pick the last numeric token as likely the amount
-        raw_val = nums[-1]
-        val = normalize_number(raw_val, lang)
-        if val is None:
-            continue
-        # match keywords
+    for val, hits in reversed(candidates):
         if lang == "de":
-            if any(k in low for k in ["mwst", "ust", "umsatzsteuer"]) and tax_amount is None:
+            if "tax" in hits and tax_amount is None:
                 tax_amount = val
                 continue
-            if any(k in low for k in ["gesamtwert inkl", "gesamtwert inkl.", "gesamtwert", "gesamtbetrag", "gesamt"]) and gross_total is None:
+            if "gross" in hits and gross_total is None:
                 gross_total = val
                 continue
-            if "netto" in low and net_total is None:
+            if "net" in hits and net_total is None:
                 net_total = val
                 continue
-            if gross_total is None and any(k in low for k in DE_TOTAL_KEYWORDS):
+            if gross_total is None and "total" in hits:
                 gross_total = val
         else:
-            if any(k in low for k in EN_VAT_KEYWORDS) and tax_amount is None:
+            if "tax" in hits and tax_amount is None:
                 tax_amount = val
                 continue
-            if any(k in low for k in EN_TOTAL_KEYWORDS) and gross_total is None:
+            if "total" in hits and gross_total is None:
                 gross_total = val
                 continue
-            if net_total is None and "net" in low:
+            if net_total is None and "net" in hits:
                 net_total = val
 
     return {"net_total": net_total, "tax_amount": tax_amount, "gross_total": gross_total}
 
 
-def _parse_line_items(text: str, lang: str = "en") -> List[InvoiceLineItem]:
+def _is_line_items_header(low: str, lang: str = "en") -> bool:
     """
-    Detects a table-like block using header keywords and parses subsequent lines.
-    This is a heuristic parser that aims for simple invoices and may be improved further.
+    Whether a lowercased line looks like the header row of the line-items table.
     """
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    items: List[InvoiceLineItem] = []
+    if lang == "de":
+        return ("pos" in low and "artikel" in low) or ("artikelbeschreibung" in low and "preis" in low) or ("menge" in low and "bestellwert" in low)
+    return ("description" in low and "price" in low) or ("quantity" in low and "description" in low)
 
-    # detect header row index
-    header_idx = None
-    for i, ln in enumerate(lines):
-        low = ln.lower()
-        if lang == "de":
-            if ("pos" in low and "artikel" in low) or ("artikelbeschreibung" in low and "preis" in low) or ("menge" in low and "bestellwert" in low):
-                header_idx = i
-                break
-        else:
-            if ("description" in low and "price" in low) or ("quantity" in low and "description" in low):
-                header_idx = i
-                break
-
-    # if header found, parse after it until we hit a totals block
-    start = header_idx + 1 if header_idx is not None else 0
-    for ln in lines[start:]:
-        low = ln.lower()
-        # stop when we reach a totals block in either language
-        if lang == "de" and any(k in low for k in DE_TOTAL_KEYWORDS + DE_VAT_KEYWORDS + ["gesamt"]):
-            break
-        if lang == "en" and any(k in low for k in EN_TOTAL_KEYWORDS + EN_VAT_KEYWORDS + ["total"]):
-            break
-
-        # Use heuristics to extract numbers: find numeric tokens and treat them as qty, unit, total (if present)
-        nums = re.findall(r"([0-9]+(?:[.,][0-9]+)?)", ln)
-        # Attempt to split description vs numeric tokens:
-        if nums:
-            # remove numeric tokens from description
-            desc = re.sub(r"[0-9]+(?:[.,][0-9]+)?", "", ln).strip(" -:|,.")
-            # If desc becomes empty, fallback to the whole line minus last numeric token
-            if not desc:
-                # try split by multiple spaces near numbers; fallback to line minus last num
-                desc = ln.rsplit(nums[-1], 1)[0].strip()
-            qty = normalize_number(nums[0], lang)
-            unit_price = normalize_number(nums[1], lang) if len(nums) >= 2 else None
-            line_total = normalize_number(nums[2], lang) if len(nums) >= 3 else None
-
-            # If only two numbers and the second is clearly larger than first, treat as price/total heuristics
-            if len(nums) == 2 and unit_price is not None and qty is not None and unit_price > qty:
-                # ambiguous: assume qty, unit_price
-                pass
-
-            # Create InvoiceLineItem if we have at least description and qty
-            if desc and qty is not None:
-                try:
-                    items.append(
-                        InvoiceLineItem(
-                            description=desc,
-                            quantity=qty,
-                            unit_price=unit_price,
-                            line_total=line_total,
-                        )
-                    )
-                except Exception as e:
-                    logging.debug(f"Failed to create InvoiceLineItem for line `{ln}`: {e}")
-                    continue
-        else:
-            # No numbers: could be multi-line description; skip for now
+
+def _parse_line_item(ln: str, lang: str = "en") -> Optional[Dict[str, object]]:
+    """
+    Parses one stripped line of the line-items table into a plain dict with the
+    InvoiceLineItem fields, or None if the line carries no usable item.
+    """
+    # Use heuristics to extract numbers: find numeric tokens and treat them as qty, unit, total (if present)
+    nums = _NUMBER_TOKEN_RE.findall(ln)
+    if not nums:
+        # No numbers: could be multi-line description; skip for now
+        return None
+
+    # Attempt to split description vs numeric tokens:
+    # remove numeric tokens from description
+    desc = _NUMBER_STRIP_RE.sub("", ln).strip(" -:|,.")
+    # If desc becomes empty, fallback to the whole line minus last numeric token
+    if not desc:
+        # try split by multiple spaces near numbers; fallback to line minus last num
+        desc = ln.rsplit(nums[-1], 1)[0].strip()
+    qty = normalize_number(nums[0], lang)
+    unit_price = normalize_number(nums[1], lang) if len(nums) >= 2 else None
+    line_total = normalize_number(nums[2], lang) if len(nums) >= 3 else None
+
+    # If only two numbers and the second is clearly larger than first, treat as price/total heuristics
+    if len(nums) == 2 and unit_price is not None and qty is not None and unit_price > qty:
+        # ambiguous: assume qty, unit_price
+        pass
+
+    # Keep the line item if we have at least description and qty.
+    # No model is validated here, so derive line_total as InvoiceLineItem's validator would.
+    if not desc or qty is None:
+        return None
+    if line_total is None and unit_price is not None:
+        line_total = qty * unit_price
+    return {
+        "description": desc,
+        "quantity": qty,
+        "unit_price": unit_price,
+        "line_total": line_total,
+    }
+
+
+def _scan_lines(lines: List[str], lines_lower: List[str], lang: str = "en") -> Dict[str, object]:
+    """
+    Collects dates, currency, totals and line items in a single pass over the invoice
+    lines instead of one full scan per field, built from the per-line helpers above.
+    Line items are parsed after the table header row (from the top if there is none)
+    until a totals block; totals are resolved bottom-up from the lines carrying an amount.
+    The invoice number is still searched on the whole text since its pattern may span a
+    line break.
+    """
+    match_keywords = _KEYWORD_MATCHERS["de" if lang == "de" else "en"]
+    dates: List[str] = []
+    currency: Optional[str] = None
+    totals_candidates: List[Tuple[float, Set[str]]] = []
+    items: List[Dict[str, object]] = []
+    header_found = False
+    # Until a header row shows up, items are collected from the top of the document
+    # (tables without a header); the header row resets them.
+    collecting_items = True
+
+    for line, low in zip(lines, lines_lower):
+        ln = line.strip()
+        if not ln:
             continue
+        # only the first two dates are used; every date format needs a "-" or "/" separator
+        if len(dates) < 2 and ("-" in ln or "/" in ln):
+            dates.extend(m.group(1) for m in islice(EN_DATE.finditer(ln), 2 - len(dates)))
+        if currency is None and ("€" in ln or "eur" in low):
+            currency = "EUR"
+
+        hits: Optional[Set[str]] = None
+        if not header_found and _is_line_items_header(low, lang):
+            header_found = True
+            collecting_items = True
+            items = []
+        elif collecting_items:
+            hits = match_keywords(low)
+            # stop when we reach a totals block
+            if "totals_block" in hits:
+                collecting_items = False
+            else:
+                item = _parse_line_item(ln, lang)
+                if item is not None:
+                    items.append(item)
+
+        val = _last_amount(ln, lang)
+        if val is not None:
+            totals_candidates.append((val, hits if hits is not None else match_keywords(low)))
+
+    return {
+        "invoice_date": dates[0] if dates else None,
+        "due_date": dates[1] if len(dates) > 1 else None,
+        "currency": currency,
+        **_resolve_totals(totals_candidates, lang),
+        "line_items": items,
+    }
+
 
-    return items
+def _parse_extracted_date(value: Optional[str], field_name: str) -> Optional[date]:
+    """
+    Parse a matched date string into a date, as Invoice validation would. model_construct()
+    skips that parsing, and raw strings would be dumped as-is (with a serializer warning).
+    Matches no accepted format can read (e.g. two-digit years) are dropped and logged.
+    """
+    if value is None:
+        return None
+    parsed = parse_maybe_date(value)
+    if parsed is None:
+        logging.info(f"Ignoring unparsable {field_name} {value!r}.")
+    return parsed
 
 
 # ---------------- High-level API ----------------
 
 
-def _extract_text_with_fallbacks(source: Union[str, Path, bytes, io.BytesIO]) -> str:
+def _extract_text_with_fallbacks(source: Union[str, Path, bytes, io.BytesIO]) -> Tuple[str, bool]:
     """
-    Attempt layout-aware text extraction first; if result is empty or clearly garbage,
-    fallback to plain extract_text and then OCR fallback.
+    Attempt layout-aware text extraction first, then OCR only the pages whose text layer
+    is empty or too short. OCR is orders of magnitude slower than reading the text layer,
+    so mixed PDFs (e.g. one scanned page among text pages) only pay for the scanned pages.
+    Returns the text and whether every OCR attempt succeeded.
     """
-    text = extract_text_layout_aware(source)
-    if text and len(text.strip()) > 20:
-        # Heuristic: if text contains many single characters or strange breaks, may still be bad.
-        # But we'll accept for now. If too short, fallback to OCR.
-        return text
-
-    logging.info("Layout-aware extraction returned little text; trying OCR fallback.")
-    ocr_text = _extract_text_with_ocr(source)
-    return ocr_text
+    pages = _extract_page_lines(source)
+    if not pages:
+        logging.info("Layout-aware extraction returned no pages; trying OCR fallback.")
+        return _extract_text_with_ocr(source)
+
+    # Heuristic: a page with fewer than MIN_PAGE_TEXT_CHARS characters has no usable text layer.
+    sparse_pages = [
+        page_idx
+        for page_idx, lines in enumerate(pages)
+        if sum(len(line.strip()) for line in lines) < MIN_PAGE_TEXT_CHARS
+    ]
+    ocr_ok = True
+    if sparse_pages:
+        logging.info(f"Pages {[i + 1 for i in sparse_pages]} returned little text; trying OCR fallback.")
+        ocr_texts = _ocr_pages(source, sparse_pages)
+        ocr_ok = None not in ocr_texts
+        for page_idx, ocr_text in zip(sparse_pages, ocr_texts):
+            if ocr_text and ocr_text.strip():
+                pages[page_idx] = ocr_text.splitlines()
+    return _join_pages(pages), ocr_ok
 
 
 def extract_invoice_from_pdf(source: Union[str, Path, bytes, io.BytesIO]) -> Invoice:
     """
     Extract a single invoice from a PDF source and returns a Pydantic Invoice.
     """
-    text = _extract_text_with_fallbacks(source)
-    if not text:
+    return _extract_invoice(source)[0]
+
+
+def _extract_invoice(source: Union[str, Path, bytes, io.BytesIO]) -> Tuple[Invoice, bool]:
+    """
+    Extract a single invoice and report whether the result may be cached: it may not when
+    OCR failed or no text was extracted at all, since a later attempt could do better.
+    """
+    text, ocr_ok = _extract_text_with_fallbacks(source)
+    # blank OCR pages still join into separators, so test for any non-whitespace text
+    if not text.strip():
         logging.warning("No text extracted from PDF (even after OCR). Returning empty invoice model.")
         # Build a minimal raw dict for Invoice model; adapt fields if your Invoice model differs.
         raw = {
@@ -399,39 +799,107 @@ def extract_invoice_from_pdf(source: Union[str, Path, bytes, io.BytesIO]) -> Inv
             "gross_total": None,
             "line_items": [],
         }
-        return Invoice.parse_obj(raw)
+        return Invoice.model_construct(**raw), False
 
-    lang = detect_language(text)
-    totals = _guess_totals(text, lang)
-    dates = _guess_dates(text, lang)
-    invoice_number = _guess_invoice_number(text, lang)
-    line_items = _parse_line_items(text, lang)
+    # split and lowercase once; every heuristic below reads these shared line lists
+    text_lower = text.lower()
+    lines = text.splitlines()
+    # lower() never adds or removes line breaks, so the two lists line up
+    lines_lower = text_lower.splitlines()
+    lang = _detect_language_from_lower(text_lower)
+    fields = _scan_lines(lines, lines_lower, lang)
 
     raw = {
-        "invoice_number": invoice_number,
-        "invoice_date": dates.get("invoice_date"),
-        "due_date": dates.get("due_date"),
+        "invoice_number": _guess_invoice_number(text, lang),
+        "invoice_date": _parse_extracted_date(fields["invoice_date"], "invoice_date"),
+        "due_date": _parse_extracted_date(fields["due_date"], "due_date"),
         "seller_name": None,
         "seller_tax_id": None,
         "buyer_name": None,
         "buyer_tax_id": None,
-        "currency": "EUR" if "eur" in text.lower() or "€" in text else None,
-        "net_total": totals.get("net_total"),
-        "tax_amount": totals.get("tax_amount"),
-        "gross_total": totals.get("gross_total"),
-        "line_items": [item.dict() for item in line_items],
+        "currency": fields["currency"],
+        "net_total": fields["net_total"],
+        "tax_amount": fields["tax_amount"],
+        "gross_total": fields["gross_total"],
+        # the validator reads line items as models, so wrap the plain dicts without re-validating
+        "line_items": [InvoiceLineItem.model_construct(**item) for item in fields["line_items"]],
     }
 
-    return Invoice.parse_obj(raw)
+    # The raw dict is built from already-normalized values; business and format checks
+    # are applied by the validator, so skip Pydantic's parse-time validation.
+    return Invoice.model_construct(**raw), ocr_ok
 
 
-def extract_invoices_from_directory(pdf_dir: Union[str, Path]) -> List[Invoice]:
-    directory = Path(pdf_dir)
-    invoices: List[Invoice] = []
-    for pdf_path in sorted(directory.glob("*.pdf")):
+def _cached_extract(pdf_path: Path, force_refresh: bool = False) -> Invoice:
+    """
+    Extract a single PDF, reusing the pickled result from CACHE_DIR when the same file
+    content was extracted before with the same CACHE_VERSION and PDF_BACKEND.
+    force_refresh re-extracts and overwrites the entry.
+    """
+    hasher = hashlib.blake2b(f"{CACHE_VERSION}:{PDF_BACKEND}:".encode(), digest_size=16)
+    hasher.update(pdf_path.read_bytes())
+    digest = hasher.hexdigest()
+    cache_path = CACHE_DIR / f"{digest}.pkl"
+    if not force_refresh and cache_path.exists():
         try:
-            logging.info(f"Processing {pdf_path}")
-            invoices.append(extract_invoice_from_pdf(pdf_path))
+            with cache_path.open("rb") as f:
+                return pickle.load(f)
         except Exception as e:
-            logging.error(f"Failed to extract {pdf_path}: {e}")
-    return invoices
+            logging.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+
+    invoice, cacheable = _extract_invoice(pdf_path)
+    if not cacheable:
+        logging.info(f"Not caching {pdf_path.name}: OCR failed or no text was extracted.")
+        return invoice
+    # write to a per-process temp file first so concurrent workers never see partial entries
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump(invoice, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        # a failed cache write must not lose the extraction itself
+        logging.warning(f"Could not write cache entry {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+    return invoice
+
+
+def extract_invoices_from_directory(
+    pdf_dir: Union[str, Path], max_workers: Optional[int] = None, force_refresh: bool = False
+) -> List[Invoice]:
+    """
+    Extract every PDF in a directory, fanning the files out over a process pool.
+
+    Each PDF is independent and extraction is CPU-bound (pdfminer parsing, OCR),
+    so processes rather than threads are used. Results keep the sorted file order.
+    max_workers throttles the pool (default: one per CPU); 1 extracts in-process without a pool.
+    Unchanged PDFs are served from the on-disk cache unless force_refresh is set.
+    """
+    directory = Path(pdf_dir)
+    pdf_paths = sorted(directory.glob("*.pdf"))
+    if not pdf_paths:
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pdf_paths))
+    if workers <= 1:
+        invoices: List[Invoice] = []
+        for pdf_path in pdf_paths:
+            try:
+                logging.info(f"Processing {pdf_path}")
+                invoices.append(_cached_extract(pdf_path, force_refresh))
+            except Exception as e:
+                logging.error(f"Failed to extract {pdf_path}: {e}")
+        return invoices
+
+    extracted: Dict[Path, Invoice] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_cached_extract, pdf_path, force_refresh): pdf_path for pdf_path in pdf_paths}
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                extracted[pdf_path] = future.result()
+                logging.info(f"Processed {pdf_path}")
+            except Exception as e:
+                logging.error(f"Failed to extract {pdf_path}: {e}")
+    return [extracted[pdf_path] for pdf_path in pdf_paths if pdf_path in extracted]
@@ -10,7 +10,7 @@ from __future__ import annotations
 from datetime import date
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class InvoiceLineItem(BaseModel):
@@ -31,22 +31,18 @@ class InvoiceLineItem(BaseModel):
         default=None, description="Total for this line (quantity * unit_price)."
     )
 
-    @validator("line_total", always=True)
-    def compute_line_total(cls, v, values):
+    # same v1 int -> str coercion as Invoice (e.g. numeric item descriptions)
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    @model_validator(mode="after")
+    def compute_line_total(self) -> "InvoiceLineItem":
         """
         If line_total is missing but quantity and unit_price are available,
         compute line_total automatically.
         """
-        if v is not None:
-            return v
-        qty = values.get("quantity")
-        price = values.get("unit_price")
-        if qty is not None and price is not None:
-            try:
-                return float(qty) * float(price)
-            except (TypeError, ValueError):
-                return None
-        return None
+        if self.line_total is None and self.quantity is not None and self.unit_price is not None:
+            self.line_total = self.quantity * self.unit_price
+        return self
 
 
 class Invoice(BaseModel):
@@ -97,8 +93,8 @@ class Invoice(BaseModel):
         default_factory=list, description="List of line items on the invoice."
     )
 
-    class Config:
-        orm_mode = True
+    # coerce_numbers_to_str keeps Pydantic v1's int -> str coercion (e.g. numeric invoice numbers)
+    model_config = ConfigDict(from_attributes=True, coerce_numbers_to_str=True)
 
 
 class InvoiceValidationError(BaseModel):
@@ -9,13 +9,18 @@ This module implements:
 The main entrypoints are:
 - `validate_invoice` for a single invoice
 - `validate_invoices` for a batch, including a summary
+
+`parse_maybe_date` is shared with the extractor, which fills dates without model validation.
 """
 
 from __future__ import annotations
 
+import re
 from collections import Counter, defaultdict
 from datetime import date, datetime
-from typing import Dict, Iterable, List, Tuple
+from typing import Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
 
 from .schema import (
     BulkValidationReport,
@@ -28,8 +33,17 @@ from .schema import (
 
 TOLERANCE = 0.5
 
+# Totals checked by the NEGATIVE_TOTAL rule, in reporting order
+_TOTAL_FIELDS = ("net_total", "tax_amount", "gross_total")
+
+# Date formats accepted by parse_maybe_date, tried in order
+_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d", "%m/%d/%Y")
+# Fast paths for the same formats, built into a date directly instead of via strptime
+_YEAR_FIRST_DATE_RE = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})")
+_YEAR_LAST_DATE_RE = re.compile(r"(\d{1,2})([-/])(\d{1,2})\2(\d{4})")
+
 
-def _parse_maybe_date(value) -> date | None:
+def parse_maybe_date(value) -> date | None:
     """
     Best-effort parser for date-like values.
     Accepts either already-parsed date objects or common string formats.
@@ -43,10 +57,33 @@ def _parse_maybe_date(value) -> date | None:
     if not isinstance(value, str):
         return None
 
-    # Try a couple of common formats.
-    for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d", "%m/%d/%Y"):
+    value = value.strip()
+    try:
+        m = _YEAR_FIRST_DATE_RE.fullmatch(value)
+        if m:
+            # %Y-%m-%d / %Y/%m/%d
+            return date(int(m.group(1)), int(m.group(3)), int(m.group(4)))
+        m = _YEAR_LAST_DATE_RE.fullmatch(value)
+        if m:
+            first, sep, second, year = m.group(1), m.group(2), m.group(3), int(m.group(4))
+            if sep == "/":
+                # %d/%m/%Y is tried before %m/%d/%Y
+                try:
+                    return date(year, int(second), int(first))
+                except ValueError:
+                    return date(year, int(first), int(second))
+            # %d-%m-%Y
+            return date(year, int(second), int(first))
+    except ValueError:
+        # digits in the right places but not a real date: no other format can match either
+        return None
+
+    # Try a couple of common formats; every one of them needs a "-" or "/" separator.
+    if "-" not in value and "/" not in value:
+        return None
+    for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(value.strip(), fmt).date()
+            return datetime.strptime(value, fmt).date()
         except ValueError:
             continue
     return None
@@ -61,6 +98,44 @@ def _almost_equal(a: float | None, b: float | None, tol: float = TOLERANCE) -> b
     return abs(a - b) <= tol
 
 
+def _scalar_total_flags(invoice: Invoice) -> Tuple[bool, List[bool]]:
+    """
+    TOTAL_MISMATCH and NEGATIVE_TOTAL flags of a single invoice, with plain comparisons.
+    Returns the mismatch flag and one negative flag per _TOTAL_FIELDS entry.
+    """
+    net, tax, gross = (getattr(invoice, field_name) for field_name in _TOTAL_FIELDS)
+    mismatch = (
+        net is not None
+        and tax is not None
+        and gross is not None
+        and not _almost_equal(net + tax, gross)
+    )
+    negative = [value is not None and value < 0 for value in (net, tax, gross)]
+    return mismatch, negative
+
+
+def _total_flags(invoices: Sequence[Invoice]) -> List[Tuple[bool, List[bool]]]:
+    """
+    Batch version of _scalar_total_flags evaluated on NumPy arrays instead of invoice by
+    invoice. Batches holding a non-numeric total (only possible for model_construct()ed
+    invoices) go through _scalar_total_flags so they behave exactly as in validate_invoice.
+    """
+    values = [[getattr(inv, field_name) for field_name in _TOTAL_FIELDS] for inv in invoices]
+    if not all(value is None or isinstance(value, (int, float)) for row in values for value in row):
+        return [_scalar_total_flags(inv) for inv in invoices]
+
+    shape = (-1, len(_TOTAL_FIELDS))
+    totals = np.array(values, dtype=np.float64).reshape(shape)
+    # track missing totals separately: a NaN total is present and fails the sum rule
+    present = np.array([[value is not None for value in row] for row in values], dtype=bool).reshape(shape)
+    net, tax, gross = totals.T
+    with np.errstate(invalid="ignore"):
+        mismatch = present.all(axis=1) & ~(np.abs(net + tax - gross) <= TOLERANCE)
+    # missing totals are NaN here, and NaN never compares as negative
+    negative = totals < 0
+    return list(zip(mismatch.tolist(), negative.tolist()))
+
+
 def validate_invoice(invoice: Invoice) -> InvoiceValidationResult:
     """
     Validate a single invoice against completeness, business, and anomaly rules.
@@ -75,6 +150,16 @@ def validate_invoice(invoice: Invoice) -> InvoiceValidationResult:
     InvoiceValidationResult
         Result indicating validity and list of errors.
     """
+    return _validate_invoice(invoice, *_scalar_total_flags(invoice))
+
+
+def _validate_invoice(
+    invoice: Invoice, total_mismatch: bool, negative_totals: Sequence[bool]
+) -> InvoiceValidationResult:
+    """
+    Validate a single invoice, taking the numeric total rules precomputed by
+    _scalar_total_flags or _total_flags.
+    """
     errors: List[InvoiceValidationError] = []
 
     # --- Completeness / Format rules ---
@@ -87,7 +172,7 @@ def validate_invoice(invoice: Invoice) -> InvoiceValidationResult:
             )
         )
 
-    parsed_invoice_date = _parse_maybe_date(invoice.invoice_date)
+    parsed_invoice_date = parse_maybe_date(invoice.invoice_date)
     if invoice.invoice_date is not None and parsed_invoice_date is None:
         errors.append(
             InvoiceValidationError(
@@ -116,24 +201,17 @@ def validate_invoice(invoice: Invoice) -> InvoiceValidationResult:
         )
 
     # --- Business rules ---
-    if (
-        invoice.net_total is not None
-        and invoice.tax_amount is not None
-        and invoice.gross_total is not None
-    ):
-        if not _almost_equal(
-            invoice.net_total + invoice.tax_amount, invoice.gross_total
-        ):
-            errors.append(
-                InvoiceValidationError(
-                    code="TOTAL_MISMATCH",
-                    field="gross_total",
-                    message=(
-                        "net_total + tax_amount should equal gross_total within "
-                        f"{TOLERANCE} tolerance."
-                    ),
-                )
+    if total_mismatch:
+        errors.append(
+            InvoiceValidationError(
+                code="TOTAL_MISMATCH",
+                field="gross_total",
+                message=(
+                    "net_total + tax_amount should equal gross_total within "
+                    f"{TOLERANCE} tolerance."
+                ),
             )
+        )
 
     # Sum of line item totals vs net_total
     if invoice.line_items and invoice.net_total is not None:
@@ -153,9 +231,8 @@ def validate_invoice(invoice: Invoice) -> InvoiceValidationResult:
             )
 
     # --- Anomaly rules ---
-    for field_name in ("net_total", "tax_amount", "gross_total"):
-        value = getattr(invoice, field_name)
-        if value is not None and value < 0:
+    for field_name, is_negative in zip(_TOTAL_FIELDS, negative_totals):
+        if is_negative:
             errors.append(
                 InvoiceValidationError(
                     code="NEGATIVE_TOTAL",
@@ -174,16 +251,20 @@ def validate_invoice(invoice: Invoice) -> InvoiceValidationResult:
 
 def _detect_duplicates(
     invoices: Iterable[Invoice],
-) -> Dict[Tuple[str | None, str | None], int]:
+) -> Set[Tuple[str | None, str | None]]:
     """
     Detect duplicate (invoice_number, seller_name) pairs.
-    Returns a counter dict keyed by (invoice_number, seller_name).
+    Returns the set of keys seen more than once.
     """
-    counter: Counter = Counter()
+    seen: Set[Tuple[str | None, str | None]] = set()
+    duplicates: Set[Tuple[str | None, str | None]] = set()
     for inv in invoices:
         key = (inv.invoice_number or None, inv.seller_name or None)
-        counter[key] += 1
-    return {k: c for k, c in counter.items() if c > 1}
+        if key in seen:
+            duplicates.add(key)
+        else:
+            seen.add(key)
+    return duplicates
 
 
 def validate_invoices(invoices: List[Invoice]) -> BulkValidationReport:
@@ -194,13 +275,11 @@ def validate_invoices(invoices: List[Invoice]) -> BulkValidationReport:
     (invoice_number, seller_name) combination.
     """
     per_invoice_results: List[InvoiceValidationResult] = []
-    duplicates = _detect_duplicates(invoices)
-
-    # Pre-build a lookup for faster duplicate detection annotation
-    duplicate_keys = {k for k, count in duplicates.items() if count > 1}
+    duplicate_keys = _detect_duplicates(invoices)
+    total_flags = _total_flags(invoices)
 
-    for invoice in invoices:
-        result = validate_invoice(invoice)
+    for invoice, (total_mismatch, negative_totals) in zip(invoices, total_flags):
+        result = _validate_invoice(invoice, total_mismatch, negative_totals)
         key = (invoice.invoice_number or None, invoice.seller_name or None)
         if key in duplicate_keys:
             result.errors.append(